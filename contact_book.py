@@ -1,21 +1,110 @@
+import atexit
+import bisect
+import hashlib
 import json
+import mmap
 import os
-import tkinter as tk
-from tkinter import ttk, messagebox, simpledialog
-from datetime import datetime
+import tempfile
+import threading
+import time
+import unicodedata
+from contextlib import contextmanager
+from operator import attrgetter
 import re
+import stat
+
+def _build_fold_table():
+    """Map accented Latin letters to their unaccented form for accent-insensitive search."""
+    table = {}
+    for code in range(0xC0, 0x250):
+        base = unicodedata.normalize('NFKD', chr(code)).encode('ascii', 'ignore').decode('ascii')
+        if base:
+            table[code] = base.lower()
+    return table
+
+# Built once; search keys and queries are folded with str.translate
+_FOLD = str.maketrans(_build_fold_table())
+
+# Books at least this large are searched through a single joined corpus
+_CORPUS_MIN_CONTACTS = 1000
+
+# Distinct queries whose results are kept between changes
+_SEARCH_MEMO_SIZE = 128
+
+# Larger result lists are not memoized, which bounds the memo to about 64k references
+_SEARCH_MEMO_MAX_RESULTS = 500
+
+# Corpus matches found by str.find before the rest of the book is scanned key by key
+_CORPUS_MAX_HITS = 256
+
+# Validation patterns, compiled once at import
+# Phones only need a digit and phone punctuation, so short numbers (911) and extensions still pass
+_PHONE_RE = re.compile(r'(?=.*\d)[\d\s+\-().#/]+(?:\s*(?:ext\.?|x)\s*\d+)?', re.IGNORECASE)
+_EMAIL_RE = re.compile(r'[^@\s]+@[^@\s]+\.[^@\s]+')
+
+_JSON_ENCODER = json.JSONEncoder(separators=(',', ':'), ensure_ascii=False)
+
+# Prefer orjson for (de)serialization when it is installed
+try:
+    import orjson
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:
+    orjson = None
+    def _dumps(obj):
+        return _JSON_ENCODER.encode(obj).encode('utf-8')
+    _loads = json.loads
+
+# Last (epoch second, formatted string) pair returned by _timestamp
+_last_timestamp = (None, "")
+
+def _timestamp():
+    """Return the current time formatted for a contact's date fields.
+
+    The string only changes once a second, so it is formatted at most once per second."""
+    global _last_timestamp
+    second = int(time.time())
+    cached_second, text = _last_timestamp
+    if second != cached_second:
+        text = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(second))
+        _last_timestamp = (second, text)
+    return text
+
+def _content_hash(data):
+    """Return a short digest of the given bytes."""
+    return hashlib.blake2b(data, digest_size=8).digest()
 
 class Contact:
     """Represents a contact with all necessary information."""
     
-    def __init__(self, name, phone, email="", address="", notes=""):
-        self.name = name
-        self.phone = phone
-        self.email = email
-        self.address = address
-        self.notes = notes
-        self.created_date = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        self.last_modified = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    __slots__ = ('name', 'phone', 'email', 'address', 'notes', 'created_date',
+                 'last_modified', 'name_lower', '_search_key', '_json_cache')
+# Slots that update() may change; the rest are derived or managed internally
+    _EDITABLE = frozenset(('name', 'phone', 'email', 'address', 'notes'))
+    
+    def __init__(self, name, phone, email="", address="", notes="",
+                 created_date=None, last_modified=None):
+# Fields are stored stripped so lookups can compare them directly
+        self.name = name.strip()
+        self.phone = phone.strip()
+        self.email = email.strip()
+        self.address = address.strip()
+        self.notes = notes.strip()
+        if created_date is None or last_modified is None:
+            now = _timestamp()
+            created_date = now if created_date is None else created_date
+            last_modified = now if last_modified is None else last_modified
+        self.created_date = created_date
+        self.last_modified = last_modified
+        self._json_cache = None
+        self._refresh_keys()
+    
+    def _refresh_keys(self):
+        """Rebuild the lowercase keys used for sorting and searching."""
+        self.name_lower = self.name.lower()
+        key = "\x1f".join((self.name, self.phone, self.email, self.address)).lower()
+# Folding only changes non-ASCII text, and most keys are plain ASCII
+        self._search_key = key if key.isascii() else key.translate(_FOLD)
     
     def to_dict(self):
         """Convert contact to dictionary for JSON storage."""
@@ -29,21 +118,36 @@ class Contact:
             'last_modified': self.last_modified
         }
     
+    def to_json(self):
+        """Return the contact encoded as JSON bytes, reusing the last encoding if unchanged."""
+        if self._json_cache is None:
+            self._json_cache = _dumps(self.to_dict())
+        return self._json_cache
+    
     @classmethod
     def from_dict(cls, data):
         """Create contact from dictionary."""
-        contact = cls(data['name'], data['phone'], data.get('email', ''), 
-                     data.get('address', ''), data.get('notes', ''))
-        contact.created_date = data.get('created_date', '')
-        contact.last_modified = data.get('last_modified', '')
-        return contact
+# Optional fields may be missing or null in older files
+        return cls(data['name'], data['phone'], data.get('email') or '',
+                   data.get('address') or '', data.get('notes') or '',
+                   data.get('created_date', ''), data.get('last_modified', ''))
     
-    def update(self, **kwargs):
-        """Update contact fields."""
+    def update(self, now=None, **kwargs):
+        """Update contact fields. Returns True if any field changed.
+
+        Pass now to reuse one timestamp across a batch of updates."""
+        changed = False
         for key, value in kwargs.items():
-            if hasattr(self, key):
+            if isinstance(value, str):
+                value = value.strip()
+            if key in self._EDITABLE and getattr(self, key) != value:
                 setattr(self, key, value)
-        self.last_modified = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                changed = True
+        if changed:
+            self.last_modified = now or _timestamp()
+            self._json_cache = None
+            self._refresh_keys()
+        return changed
     
     def __str__(self):
         return f"{self.name} - {self.phone}"
@@ -51,462 +155,383 @@ class Contact:
 class ContactBook:
     """Main contact book class that manages contacts and file operations."""
     
-    def __init__(self, filename="contacts.json"):
+    def __init__(self, filename="contacts.json", save_delay=0, load=True):
         self.filename = filename
-        self.contacts = []
-        self.load_contacts()
+# Contacts keyed by phone number, in insertion order
+        self.contacts = {}
+# Contacts ordered by lowercase name, with their keys in a parallel list for bisect
+        self._sorted = []
+        self._sorted_keys = []
+# Read-only snapshot of _sorted handed out by get_all_contacts, rebuilt after it changes
+        self._sorted_view = None
+# Last search, reused when the next query extends it
+        self._last_query = ""
+        self._last_results = None
+# Results of recent queries, reused for exact repeats until the book changes
+        self._search_memo = {}
+# Search keys joined into one string for large books, built on first search
+        self._corpus = None
+# Running counts for get_statistics
+        self._n_email = 0
+        self._n_address = 0
+# Seconds to coalesce edits before writing; 0 saves on every change
+        self.save_delay = save_delay
+        self._dirty = False
+        self._bulk_depth = 0
+        self._save_lock = threading.Lock()
+        self._last_saved_hash = None
+# Error from the most recent failed save, or None once a save succeeds
+        self.save_error = None
+# Held while contacts change and while a save encodes them
+        self._data_lock = threading.Lock()
+# Pass load=False to call load_contacts later, e.g. from a worker thread
+        self.loaded = False
+        if load:
+            self.load_contacts()
+# With a delay, saves happen on a background writer thread so the UI never waits on disk
+        if save_delay:
+            self._dirty_event = threading.Event()
+            threading.Thread(target=self._writer_loop, daemon=True).start()
+            atexit.register(self.flush)
     
     def add_contact(self, name, phone, email="", address="", notes=""):
         """Add a new contact."""
+        contact = self._add(Contact(name, phone, email, address, notes))
+        self._mark_dirty()
+        return contact
+    
+    def add_contacts(self, entries):
+        """Add several contacts, given as dicts of add_contact arguments, saving once at the end.
+
+        Stops at the first invalid entry; the contacts added before it are kept."""
+        now = _timestamp()
+        added = []
+        try:
+            for entry in entries:
+                added.append(self._add(Contact(**{'created_date': now, 'last_modified': now, **entry})))
+        finally:
+            if added:
+                self._mark_dirty()
+        return added
+    
+    def _add(self, contact):
+        """Validate a new contact and index it, without saving."""
 # Validate input
-        if not name.strip() or not phone.strip():
+        if not contact.name or not contact.phone:
             raise ValueError("Name and phone number are required.")
         
+        if not _PHONE_RE.fullmatch(contact.phone):
+            raise ValueError("Invalid phone number.")
+        if contact.email and not _EMAIL_RE.fullmatch(contact.email):
+            raise ValueError("Invalid email address.")
+        
 # Check for duplicate phone numbers
-        if any(contact.phone == phone for contact in self.contacts):
+        if contact.phone in self.contacts:
             raise ValueError("A contact with this phone number already exists.")
         
-        contact = Contact(name.strip(), phone.strip(), email.strip(), 
-                        address.strip(), notes.strip())
-        self.contacts.append(contact)
-        self.save_contacts()
+        with self._data_lock:
+            self.contacts[contact.phone] = contact
+            self._insert_sorted(contact)
+            self._count(contact, 1)
         return contact
     
     def get_contact_by_phone(self, phone):
         """Get contact by phone number."""
-        phone = phone.strip()
-        for contact in self.contacts:
-           if contact.phone.strip() == phone:
-            return contact
-        return None
-
+        return self.contacts.get(phone.strip())
     
     def search_contacts(self, query):
-        """Search contacts by name, phone, or email."""
-        query = query.lower()
+        """Search contacts by name, phone, email, or address."""
+        query = query.strip().lower().translate(_FOLD)
+        if not query:
+            return list(self.contacts.values())
+        results = self._search_memo.get(query)
+        if results is None:
+# Anything matching the longer query also matched its prefix, so only rescan those
+            if self._last_results is not None and query.startswith(self._last_query):
+                results = [contact for contact in self._last_results if query in contact._search_key]
+            elif len(self.contacts) >= _CORPUS_MIN_CONTACTS and '\x00' not in query:
+                results = self._search_corpus(query)
+            else:
+                results = [contact for contact in self.contacts.values() if query in contact._search_key]
+            if len(self._search_memo) < _SEARCH_MEMO_SIZE and len(results) <= _SEARCH_MEMO_MAX_RESULTS:
+                self._search_memo[query] = results
+        self._last_query = query
+        self._last_results = results
+        return list(results)
+
+    def search_by_name_prefix(self, prefix):
+        """Return contacts whose name starts with prefix (case-insensitive), sorted by name."""
+        prefix = prefix.strip().lower()
+# Names sharing the prefix are contiguous in the sorted list
+        start = bisect.bisect_left(self._sorted_keys, prefix)
+        end = start
+        while end < len(self._sorted_keys) and self._sorted_keys[end].startswith(prefix):
+            end += 1
+        return self._sorted[start:end]
+
+    def _search_corpus(self, query):
+        """Find matches with str.find over all search keys joined into one string."""
+        if self._corpus is None:
+            contacts = list(self.contacts.values())
+            starts = []
+            position = 0
+            for contact in contacts:
+                starts.append(position)
+                position += len(contact._search_key) + 1
+            self._corpus = ("\x00".join(contact._search_key for contact in contacts), starts, contacts)
+        corpus, starts, contacts = self._corpus
         results = []
-        for contact in self.contacts:
-            if (query in contact.name.lower() or 
-                query in contact.phone or 
-                (contact.email and query in contact.email.lower())):
-                results.append(contact)
+        i = corpus.find(query)
+        while i != -1:
+            n = bisect.bisect_right(starts, i) - 1
+            results.append(contacts[n])
+# Dense matches cost a find and a bisect each; past a few, testing each remaining key is cheaper
+            if len(results) == _CORPUS_MAX_HITS:
+                results.extend(contact for contact in contacts[n + 1:] if query in contact._search_key)
+                break
+# Resume at the next contact's key so each contact is reported once
+            if n + 1 == len(starts):
+                break
+            i = corpus.find(query, starts[n + 1])
         return results
 
     def update_contact(self, original_phone, name=None, phone=None, email=None, address=None, notes=None):
-        """Update contact details based on original phone number."""
+        """Update contact details based on original phone number.
 
-        
-        contact = self.get_contact_by_phone(original_phone)
+        Fields left as None are unchanged; an empty string clears an optional field."""
+        contact = self.contacts.get(original_phone.strip())
         if not contact:
             raise ValueError("Contact not found.")
+        if (name is not None and not name.strip()) or (phone is not None and not phone.strip()):
+            raise ValueError("Name and phone number are required.")
 
-        # If phone changed, check for duplicates
-        if phone and phone != original_phone:
-            if self.find_contact_by_phone(phone):
-               raise ValueError("Duplicate phone number.")
+# If phone changed, check it against the phone index for duplicates
+        if phone is not None:
+            phone = phone.strip()
+        if phone is not None and phone != contact.phone:
+            if not _PHONE_RE.fullmatch(phone):
+                raise ValueError("Invalid phone number.")
+            if phone in self.contacts:
+                raise ValueError("Duplicate phone number.")
+# Only a changed email is checked, so contacts saved before validation can still be edited
+        if email is not None:
+            email = email.strip()
+        if email and email != contact.email and not _EMAIL_RE.fullmatch(email):
+            raise ValueError("Invalid email address.")
 
-        if name:
-            contact.name = name
-        if phone:
-            contact.phone = phone
-        if email:
-            contact.email = email
-        if address:
-            contact.address = address
-        if notes:
-            contact.notes = notes  # <-- new field handled here
- 
-        self.save_contacts()
+        changes = {'name': name, 'phone': phone, 'email': email,
+                   'address': address, 'notes': notes}
+        old_phone = contact.phone
+        old_key = contact.name_lower
+        with self._data_lock:
+            self._count(contact, -1)
+# Only apply fields that were given; skip the save if nothing changed
+            changed = contact.update(**{k: v for k, v in changes.items() if v is not None})
+            self._count(contact, 1)
+            if not changed:
+                return
+            if contact.phone != old_phone:
+                self.contacts[contact.phone] = self.contacts.pop(old_phone)
+            if contact.name_lower != old_key:
+                self._remove_sorted(contact, old_key)
+                self._insert_sorted(contact)
+        self._mark_dirty()
 
     def delete_contact(self, phone):
         """Delete a contact by phone number."""
-        contact = self.get_contact_by_phone(phone)
-        if contact:
-            self.contacts.remove(contact)
-            self.save_contacts()
+        with self._data_lock:
+            contact = self.contacts.pop(phone.strip(), None)
+            if contact is not None:
+                self._remove_sorted(contact, contact.name_lower)
+                self._count(contact, -1)
+        if contact is not None:
+            self._mark_dirty()
             return True
         return False
     
+    def _insert_sorted(self, contact):
+        """Insert a contact into the name-ordered list, after any equal names."""
+        i = bisect.bisect_right(self._sorted_keys, contact.name_lower)
+        self._sorted_keys.insert(i, contact.name_lower)
+        self._sorted.insert(i, contact)
+        self._sorted_view = None
+    
+    def _remove_sorted(self, contact, key):
+        """Remove a contact filed under key from the name-ordered list."""
+        i = bisect.bisect_left(self._sorted_keys, key)
+        while self._sorted[i] is not contact:
+            i += 1
+        del self._sorted_keys[i]
+        del self._sorted[i]
+        self._sorted_view = None
+    
+    def _count(self, contact, delta):
+        """Add delta to the statistics counters the contact contributes to."""
+        if contact.email:
+            self._n_email += delta
+        if contact.address:
+            self._n_address += delta
+    
     def get_all_contacts(self):
-        """Get all contacts sorted by name."""
-        return sorted(self.contacts, key=lambda x: x.name.lower())
+        """Get all contacts sorted by name, as a tuple shared until the book changes."""
+        if self._sorted_view is None:
+            self._sorted_view = tuple(self._sorted)
+        return self._sorted_view
     
     def load_contacts(self):
         """Load contacts from JSON file."""
         try:
-            if os.path.exists(self.filename):
-                with open(self.filename, 'r', encoding='utf-8') as file:
-                    data = json.load(file)
-                    self.contacts = [Contact.from_dict(contact_data) for contact_data in data]
+            with open(self.filename, 'rb') as file:
+# orjson can parse a read-only mapping of the file directly, skipping the copy read() makes
+                if orjson is not None and os.fstat(file.fileno()).st_size:
+                    with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped, \
+                            memoryview(mapped) as raw:
+                        data = _loads(raw)
+                        content_hash = _content_hash(raw)
+                else:
+                    raw = file.read()
+                    data = _loads(raw)
+                    content_hash = _content_hash(raw)
+            contacts = {}
+            for contact in map(Contact.from_dict, data):
+# Refuse rather than keep one of them: the next save would drop the others from disk
+                if contact.phone in contacts:
+                    raise ValueError(f"More than one contact in {self.filename} has the phone number "
+                                     f"{contact.phone!r}; fix the file before loading it.")
+                contacts[contact.phone] = contact
+            self.contacts = contacts
+            self._last_saved_hash = content_hash
         except (json.JSONDecodeError, FileNotFoundError):
-            self.contacts = []
+            self.contacts = {}
+            self._last_saved_hash = None
+        self._sorted = sorted(self.contacts.values(), key=attrgetter('name_lower'))
+        self._sorted_keys = [contact.name_lower for contact in self._sorted]
+        self._sorted_view = None
+        self._last_results = None
+        self._search_memo = {}
+        self._corpus = None
+        self._n_email = self._n_address = 0
+        for contact in self.contacts.values():
+            self._count(contact, 1)
+        self.loaded = True
+    
+    def reload(self):
+        """Re-read the contact file into this book, discarding changes not yet saved."""
+        with self._save_lock:
+            self._dirty = False
+            self.load_contacts()
     
     def save_contacts(self):
-        """Save contacts to JSON file."""
+        """Save contacts to JSON file, replacing it atomically.
+
+        The write is skipped when the encoded contents match what was last
+        loaded or saved."""
         try:
-            with open(self.filename, 'w', encoding='utf-8') as file:
-                json.dump([contact.to_dict() for contact in self.contacts], 
-                         file, indent=2, ensure_ascii=False)
+# A delayed save runs on the writer thread; encode under the data lock so no edit
+# lands halfway through a contact's encoding and leaves a stale cached copy
+            with self._data_lock:
+# Contacts cache their own encoding, so only changed ones are re-encoded
+                content = b'[' + b','.join(contact.to_json() for contact in self.contacts.values()) + b']'
+            content_hash = _content_hash(content)
+            if content_hash == self._last_saved_hash:
+                return
+            directory = os.path.dirname(os.path.abspath(self.filename))
+            fd, temp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as file:
+                    file.write(content)
+# mkstemp creates the file as 0600; keep the mode the user's file had
+                try:
+                    mode = stat.S_IMODE(os.stat(self.filename).st_mode)
+                except FileNotFoundError:
+                    umask = os.umask(0)
+                    os.umask(umask)
+                    mode = 0o666 & ~umask
+                os.chmod(temp_path, mode)
+                os.replace(temp_path, self.filename)
+                self._last_saved_hash = content_hash
+            except BaseException:
+                os.unlink(temp_path)
+                raise
         except Exception as e:
             raise Exception(f"Error saving contacts: {e}")
     
-    def get_statistics(self):
-        """Get contact book statistics."""
-        total_contacts = len(self.contacts)
-        contacts_with_email = len([c for c in self.contacts if c.email])
-        contacts_with_address = len([c for c in self.contacts if c.address])
-        return {
-            'total_contacts': total_contacts,
-            'contacts_with_email': contacts_with_email,
-            'contacts_with_address': contacts_with_address
-        }
-
-class ContactBookGUI:
-    """GUI interface for the contact book using Tkinter."""
-    
-    def __init__(self, contact_book):
-        self.contact_book = contact_book
-        self.root = tk.Tk()
-        self.root.title("Contact Book")
-        self.root.geometry("800x600")
-        self.root.configure(bg='#f0f0f0')
-        
-# Style configuration
-        style = ttk.Style()
-        style.theme_use('clam')
-        
-        self.setup_ui()
-        self.refresh_contact_list()
-    
-    def setup_ui(self):
-        """Setup the user interface."""
-# Main frame
-        main_frame = ttk.Frame(self.root, padding="10")
-        main_frame.grid(row=0, column=0, sticky="nsew")
-        
-# --- GUI Responsiveness Fixes ---
-# Ensure all columns and rows expand as window resizes
-        self.root.columnconfigure(0, weight=1)
-        self.root.rowconfigure(0, weight=1)
-        main_frame.columnconfigure(0, weight=0)  # Buttons column
-        main_frame.columnconfigure(1, weight=1)  # List column
-        main_frame.rowconfigure(0, weight=0)     # Title row
-        main_frame.rowconfigure(1, weight=1)     # Main content row
-        main_frame.rowconfigure(2, weight=0)     # Search row
-
-# For search_frame
-        search_frame = ttk.Frame(main_frame)
-        search_frame.grid(row=2, column=0, columnspan=3, pady=10, sticky="we")
-        search_frame.columnconfigure(0, weight=0)
-        search_frame.columnconfigure(1, weight=1)
-
-# For list_frame
-        list_frame = ttk.Frame(main_frame)
-        list_frame.grid(row=1, column=1, sticky="nsew", padx=(10, 0))
-        list_frame.columnconfigure(0, weight=1)
-        list_frame.rowconfigure(0, weight=1)
-        
-# Treeview for contacts
-        columns = ('Name', 'Phone', 'Email', 'Address')
-        self.tree = ttk.Treeview(list_frame, columns=columns, show='headings', height=15)
-        
-# Configure columns
-        for col in columns:
-            self.tree.heading(col, text=col)
-            self.tree.column(col, width=150)
-        
-# Scrollbar
-        scrollbar = ttk.Scrollbar(list_frame, orient=tk.VERTICAL, command=self.tree.yview)
-        self.tree.configure(yscrollcommand=scrollbar.set)
-        
-        self.tree.grid(row=0, column=0, sticky="nsew")
-        scrollbar.grid(row=0, column=1, sticky="ns")
-        
-# Title
-        title_label = ttk.Label(main_frame, text="Contact Book", 
-                               font=('Arial', 16, 'bold'))
-        title_label.grid(row=0, column=0, columnspan=3, pady=(0, 20))
-        
-# Buttons frame
-        buttons_frame = ttk.Frame(main_frame)
-        buttons_frame.grid(row=1, column=0, sticky="nw", padx=(0, 10))
-        
-# Buttons
-        ttk.Button(buttons_frame, text="Add Contact", 
-                  command=self.add_contact_dialog).grid(row=0, column=0, pady=5, sticky=tk.W)
-        ttk.Button(buttons_frame, text="Edit Contact", 
-                  command=self.edit_contact_dialog).grid(row=1, column=0, pady=5, sticky=tk.W)
-        ttk.Button(buttons_frame, text="Delete Contact", 
-                  command=self.delete_contact_dialog).grid(row=2, column=0, pady=5, sticky=tk.W)
-        ttk.Button(buttons_frame, text="Search", 
-                  command=self.search_dialog).grid(row=3, column=0, pady=5, sticky=tk.W)
-        ttk.Button(buttons_frame, text="View Statistics", 
-                  command=self.show_statistics).grid(row=4, column=0, pady=5, sticky=tk.W)
-        
-# Search entry
-        ttk.Label(search_frame, text="Quick Search:").grid(row=0, column=0, padx=(0, 5))
-        self.search_var = tk.StringVar()
-        self.search_var.trace('w', self.on_search_change)
-        search_entry = ttk.Entry(search_frame, textvariable=self.search_var, width=40)
-        search_entry.grid(row=0, column=1, sticky="we")
-        
-# Bind double-click event
-        self.tree.bind('<Double-1>', self.on_contact_double_click)
-    
-    def refresh_contact_list(self, contacts=None):
-        """Refresh the contact list display and keep Treeview in sync with backend.
-        Always clear selection after refresh to avoid stale selection issues when phone numbers change."""
-# Clear existing items
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-# Add contacts
-        if contacts is None:
-            contacts = self.contact_book.get_all_contacts()
-        for contact in contacts:
-            self.tree.insert('', 'end', values=(
-                contact.name,
-                contact.phone,
-                contact.email,
-                contact.address
-            ))
-# Always clear selection after refresh
-        self.tree.selection_remove(self.tree.selection())
-    
-    def on_search_change(self, *args):
-        """Handle search input changes."""
-        query = self.search_var.get().strip()
-        if query:
-            results = self.contact_book.search_contacts(query)
-            self.refresh_contact_list(results)
+    def export_contacts(self, filename):
+        """Write the contacts, sorted by name, to filename as indented JSON for reading."""
+        try:
+            with open(filename, 'w', encoding='utf-8') as file:
+                json.dump([contact.to_dict() for contact in self._sorted], file,
+                          indent=2, ensure_ascii=False)
+        except Exception as e:
+            raise Exception(f"Error exporting contacts: {e}")
+    
+    def _mark_dirty(self):
+        """Record a pending change and schedule it to be saved."""
+        self._last_results = None
+        self._search_memo.clear()
+        self._corpus = None
+        self._dirty = True
+        if not self._bulk_depth:
+            self._schedule_save()
+    
+    def _schedule_save(self):
+        """Save now, or wake the writer thread when saves are delayed."""
+        if self.save_delay:
+            self._dirty_event.set()
         else:
-            self.refresh_contact_list()
-    
-    def get_selected_contact(self):
-        """Get the currently selected contact. Returns None and shows a warning if nothing is selected or if the contact is not found."""
-        selection = self.tree.selection()
-        if not selection:
-            messagebox.showwarning("No Selection", "Please select a contact first.")
-            return None
-        item = self.tree.item(selection[0])
-        if not item or not item.get('values') or len(item['values']) < 2:
-            messagebox.showwarning("Selection Error", "Could not retrieve contact details from selection.")
-            return None
-        phone = str(item['values'][1]).strip()  # FIXED: Strip to ensure matching
-        contact = self.contact_book.get_contact_by_phone(phone)
-        if not contact:
-            messagebox.showwarning("Not Found", "Selected contact could not be found.")
-        return contact
-
-
-    def add_contact_dialog(self):
-        """Show dialog to add a new contact."""
-        dialog = ContactDialog(self.root, "Add New Contact")
-        self.root.wait_window(dialog.dialog)  # Wait for dialog to close
-        if dialog.result:
-            try:
-                self.contact_book.add_contact(**dialog.result)
-                self.refresh_contact_list()
-                self.tree.selection_remove(self.tree.selection())  # Clear selection
-                messagebox.showinfo("Success", "Contact added successfully!")
-            except ValueError as e:
-                messagebox.showerror("Error", str(e))
+            self.flush()
     
-    def edit_contact_dialog(self):
-        """Show dialog to edit selected contact."""
-        contact = self.get_selected_contact()
-        if not contact:
-            return  # Feedback already given in get_selected_contact
-        dialog = ContactDialog(self.root, "Edit Contact", contact)
-        self.root.wait_window(dialog.dialog)  # Wait for dialog to close
-        if dialog.result:
+    @contextmanager
+    def bulk(self):
+        """Defer saving until the outermost bulk() block ends, then save once. Reentrant."""
+        self._bulk_depth += 1
+        try:
+            yield self
+        finally:
+            self._bulk_depth -= 1
+            if self._bulk_depth == 0 and self._dirty:
+                self._schedule_save()
+    
+    def _writer_loop(self):
+        """Save pending changes in the background, coalescing bursts of edits."""
+        while True:
+            self._dirty_event.wait()
+            time.sleep(self.save_delay)
+            self._dirty_event.clear()
             try:
-                # Use the original phone to update, but allow phone to change
-                self.contact_book.update_contact(contact.phone, **dialog.result)
-                self.refresh_contact_list()
-                self.tree.selection_remove(self.tree.selection())  # Clear selection after edit
-                messagebox.showinfo("Success", "Contact updated successfully!")
-            except ValueError as e:
-                messagebox.showerror("Error", str(e))
-    
-    def delete_contact_dialog(self):
-        """Show dialog to delete selected contact."""
-        contact = self.get_selected_contact()
-        if not contact:
-            return  # Feedback already given in get_selected_contact
-        if messagebox.askyesno("Confirm Delete", f"Are you sure you want to delete {contact.name}?"):
-            self.contact_book.delete_contact(contact.phone)
-            self.refresh_contact_list()
-            self.tree.selection_remove(self.tree.selection())  # Clear selection after delete
-            messagebox.showinfo("Success", "Contact deleted successfully!")
-    
-    def search_dialog(self):
-        """Show advanced search dialog."""
-        query = simpledialog.askstring("Search Contacts", 
-                                     "Enter search term (name, phone, or email):")
-        if query:
-            results = self.contact_book.search_contacts(query)
-            if results:
-                self.refresh_contact_list(results)
-                messagebox.showinfo("Search Results", f"Found {len(results)} contact(s)")
-            else:
-                messagebox.showinfo("Search Results", "No contacts found.")
-    
-    def show_statistics(self):
-        """Show contact book statistics."""
-        stats = self.contact_book.get_statistics()
-        message = f"""Contact Book Statistics:
-        
-        Total Contacts: {stats['total_contacts']}
-        Contacts with Email: {stats['contacts_with_email']}
-        Contacts with Address: {stats['contacts_with_address']}"""
-        
-        messagebox.showinfo("Statistics", message)
-    
-    def on_contact_double_click(self, event):
-        """Handle double-click on contact to view details."""
-        contact = self.get_selected_contact()
-        if contact:
-            self.show_contact_details(contact)
-    
-    def show_contact_details(self, contact):
-        """Show detailed view of a contact."""
-        details_window = tk.Toplevel(self.root)
-        details_window.title(f"Contact Details - {contact.name}")
-        details_window.geometry("400x300")
-        details_window.configure(bg='#f0f0f0')
-        
-# Center the window
-        details_window.transient(self.root)
-        details_window.grab_set()
-        
-# Details frame
-        frame = ttk.Frame(details_window, padding="20")
-        frame.grid(row=0, column=0, sticky="nsew")
-        
-        details_window.columnconfigure(0, weight=1)
-        details_window.rowconfigure(0, weight=1)
-        frame.columnconfigure(1, weight=1)
-        
-# Contact details
-        ttk.Label(frame, text="Name:", font=('Arial', 10, 'bold')).grid(row=0, column=0, sticky=tk.W, pady=2)
-        ttk.Label(frame, text=contact.name).grid(row=0, column=1, sticky=tk.W, pady=2)
-        
-        ttk.Label(frame, text="Phone:", font=('Arial', 10, 'bold')).grid(row=1, column=0, sticky=tk.W, pady=2)
-        ttk.Label(frame, text=contact.phone).grid(row=1, column=1, sticky=tk.W, pady=2)
-        
-        ttk.Label(frame, text="Email:", font=('Arial', 10, 'bold')).grid(row=2, column=0, sticky=tk.W, pady=2)
-        ttk.Label(frame, text=contact.email or "N/A").grid(row=2, column=1, sticky=tk.W, pady=2)
-        
-        ttk.Label(frame, text="Address:", font=('Arial', 10, 'bold')).grid(row=3, column=0, sticky=tk.W, pady=2)
-        ttk.Label(frame, text=contact.address or "N/A").grid(row=3, column=1, sticky=tk.W, pady=2)
-        
-        ttk.Label(frame, text="Notes:", font=('Arial', 10, 'bold')).grid(row=4, column=0, sticky=tk.W, pady=2)
-        ttk.Label(frame, text=contact.notes or "N/A").grid(row=4, column=1, sticky=tk.W, pady=2)
-        
-        ttk.Label(frame, text="Created:", font=('Arial', 10, 'bold')).grid(row=5, column=0, sticky=tk.W, pady=2)
-        ttk.Label(frame, text=contact.created_date).grid(row=5, column=1, sticky=tk.W, pady=2)
-        
-        ttk.Label(frame, text="Modified:", font=('Arial', 10, 'bold')).grid(row=6, column=0, sticky=tk.W, pady=2)
-        ttk.Label(frame, text=contact.last_modified).grid(row=6, column=1, sticky=tk.W, pady=2)
-        
-# Close button
-        ttk.Button(frame, text="Close", command=details_window.destroy).grid(row=7, column=0, columnspan=2, pady=20)
-    
-    def run(self):
-        """Start the GUI application."""
-        self.root.mainloop()
-
-class ContactDialog:
-    """Dialog for adding/editing contacts."""
-    
-    def __init__(self, parent, title, contact=None):
-        self.result = None
-        
-# Create dialog window
-        self.dialog = tk.Toplevel(parent)
-        self.dialog.title(title)
-        self.dialog.geometry("400x350")
-        self.dialog.configure(bg='#f0f0f0')
-        
-# Center the window
-        self.dialog.transient(parent)
-        self.dialog.grab_set()
-        
-# Variables
-        self.name_var = tk.StringVar(value=contact.name if contact else "")
-        self.phone_var = tk.StringVar(value=contact.phone if contact else "")
-        self.email_var = tk.StringVar(value=contact.email if contact else "")
-        self.address_var = tk.StringVar(value=contact.address if contact else "")
-        self.notes_var = tk.StringVar(value=contact.notes if contact else "")
-        
-        self.setup_ui()
-    
-    def setup_ui(self):
-        """Setup the dialog UI."""
-        frame = ttk.Frame(self.dialog, padding="20")
-        frame.grid(row=0, column=0, sticky="nsew")
-        
-        self.dialog.columnconfigure(0, weight=1)
-        self.dialog.rowconfigure(0, weight=1)
-        frame.columnconfigure(1, weight=1)
-        
-# Title
-        ttk.Label(frame, text="Contact Information", 
-                 font=('Arial', 12, 'bold')).grid(row=0, column=0, columnspan=2, pady=(0, 20))
-        
-# Form fields
-        ttk.Label(frame, text="Name *:").grid(row=1, column=0, sticky=tk.W, pady=2)
-        ttk.Entry(frame, textvariable=self.name_var, width=30).grid(row=1, column=1, sticky="we", pady=2)
-        
-        ttk.Label(frame, text="Phone *:").grid(row=2, column=0, sticky=tk.W, pady=2)
-        ttk.Entry(frame, textvariable=self.phone_var, width=30).grid(row=2, column=1, sticky="we", pady=2)
-        
-        ttk.Label(frame, text="Email:").grid(row=3, column=0, sticky=tk.W, pady=2)
-        ttk.Entry(frame, textvariable=self.email_var, width=30).grid(row=3, column=1, sticky="we", pady=2)
-        
-        ttk.Label(frame, text="Address:").grid(row=4, column=0, sticky=tk.W, pady=2)
-        ttk.Entry(frame, textvariable=self.address_var, width=30).grid(row=4, column=1, sticky="we", pady=2)
-        
-        ttk.Label(frame, text="Notes:").grid(row=5, column=0, sticky=tk.W, pady=2)
-        notes_entry = ttk.Entry(frame, textvariable=self.notes_var, width=30)
-        notes_entry.grid(row=5, column=1, sticky="we", pady=2)
-        
-# Buttons
-        button_frame = ttk.Frame(frame)
-        button_frame.grid(row=6, column=0, columnspan=2, pady=20)
-        
-        ttk.Button(button_frame, text="Save", command=self.save).grid(row=0, column=0, padx=5)
-        ttk.Button(button_frame, text="Cancel", command=self.cancel).grid(row=0, column=1, padx=5)
-        
-# Focus on name field
-        frame.focus_set()
+                self.flush()
+            except Exception:
+                pass  # Kept in save_error for the application to report
+    
+    def flush(self):
+        """Write any pending changes to disk."""
+        with self._save_lock:
+            if self._dirty:
+# Clear first so edits made while saving are picked up by the next flush
+                self._dirty = False
+                try:
+                    self.save_contacts()
+                except Exception as e:
+                    self._dirty = True
+                    self.save_error = e
+                    raise
+                self.save_error = None
     
-    def save(self):
-        """Save the contact information."""
-        name = self.name_var.get().strip()
-        phone = self.phone_var.get().strip()
-        
-        if not name or not phone:
-            messagebox.showerror("Error", "Name and phone number are required.")
-            return
-        
-        self.result = {
-            'name': name,
-            'phone': phone,
-            'email': self.email_var.get().strip(),
-            'address': self.address_var.get().strip(),
-            'notes': self.notes_var.get().strip()
+    def get_statistics(self):
+        """Get contact book statistics."""
+        return {
+            'total_contacts': len(self.contacts),
+            'contacts_with_email': self._n_email,
+            'contacts_with_address': self._n_address
         }
-        
-        self.dialog.destroy()
-    
-    def cancel(self):
-        """Cancel the dialog."""
-        self.dialog.destroy()
 
 def console_interface():
     """Console-based interface for the contact book."""
-    contact_book = ContactBook()
+    try:
+        contact_book = ContactBook()
+    except ValueError as e:
+        print(f"Error loading contacts: {e}")
+        return
     
     def print_menu():
         print("\n" + "="*50)
@@ -583,10 +608,13 @@ def console_interface():
             contact = contact_book.get_contact_by_phone(original_phone)
             if contact:
                 print(f"Editing contact: {contact.name}")
+                print("Leave a field blank to keep its current value.")
                 name, new_phone, email, address, notes = get_contact_info()
+                changes = {'name': name, 'phone': new_phone, 'email': email,
+                           'address': address, 'notes': notes}
                 try:
-                    contact_book.update_contact(original_phone, name=name, phones=new_phone, 
-                                             email=email, address=address, notes=notes)
+                    contact_book.update_contact(original_phone,
+                                                **{k: v for k, v in changes.items() if v})
                     print("Contact updated successfully!")
                 except ValueError as e:
                     print(f"Error: {e}")
@@ -629,7 +657,9 @@ def main():
             console_interface()
             break
         elif choice == '2':
-            contact_book = ContactBook()
+# Tk is only loaded when the GUI is chosen
+            from contact_book_gui import ContactBookGUI
+            contact_book = ContactBook(save_delay=0.5, load=False)
             gui = ContactBookGUI(contact_book)
             gui.run()
             break
@@ -0,0 +1,650 @@
+#!/usr/bin/env python3
+"""
+Tkinter GUI for the Contact Book application.
+Kept separate from contact_book so the core classes can be imported without loading Tk.
+"""
+
+import threading
+import tkinter as tk
+from tkinter import ttk, messagebox, simpledialog
+from contextlib import contextmanager, nullcontext
+from contact_book import ContactBook
+
+# Row changes above which the contact list is rebuilt with the Treeview detached
+_BULK_REFRESH_ROWS = 50
+
+# Lists longer than this only keep the visible rows in the Treeview
+_VIRTUAL_ROWS = 500
+
+# Layout of the contact dialog's canvas-drawn form, in pixels
+_FORM_LABEL_WIDTH = 80
+_FORM_ROW_HEIGHT = 28
+
+def _configure_styles(root):
+    """Apply the ttk theme to root; theme state belongs to each Tk interpreter."""
+    style = ttk.Style(root)
+    style.theme_use('clam')
+
+class ContactBookGUI:
+    """GUI interface for the contact book using Tkinter."""
+    
+    def __init__(self, contact_book):
+        self.contact_book = contact_book
+        self.root = tk.Tk()
+        self.root.title("Contact Book")
+        self.root.geometry("800x600")
+        self.root.configure(bg='#f0f0f0')
+        self._search_after_id = None
+# Quick-search query the list currently shows ('' for all contacts, None for other results)
+        self._shown_query = None
+        self._contact_dialog = None
+# Worker thread loading the contact file, while one is running
+        self._loader = None
+        self._load_error = None
+# Last background save error shown to the user, so each failure is reported once
+        self._reported_save_error = None
+# Mirror of the Treeview rows (iid -> (contact, shown values), and display order) so refreshes can diff without querying Tk
+        self._rows = {}
+        self._row_order = []
+        self._tree_batch_depth = 0
+        self._batch_depth = 0
+        self._batch_dirty = False
+# Contacts currently listed; past _VIRTUAL_ROWS only the visible slice of them is in the Treeview
+        self._view = []
+        self._view_offset = 0
+        self._visible_rows = 15
+        self._virtual = False
+        
+# Style configuration
+        _configure_styles(self.root)
+        
+        self.setup_ui()
+        if contact_book.loaded:
+            self.refresh_contact_list()
+        else:
+            self._start_loading()
+    
+    def _start_loading(self):
+        """Load the contact file on a worker thread so the window can draw meanwhile."""
+        self.root.title("Contact Book (loading...)")
+        self._loader = threading.Thread(target=self._load_contacts, daemon=True)
+        self._loader.start()
+        self.root.after(50, self._check_loading)
+    
+    def _load_contacts(self):
+        """Run load_contacts on the loader thread, keeping any error for the main thread."""
+        try:
+            self.contact_book.load_contacts()
+        except Exception as e:
+            self._load_error = e
+    
+    def _check_loading(self):
+        """Poll the loader and show the contacts once it finishes; Tk is only touched from this thread."""
+        if self._loader.is_alive():
+            self.root.after(50, self._check_loading)
+            return
+        self._loader = None
+        if self._load_error is not None or not self.contact_book.loaded:
+# Close rather than let the first edit overwrite a file that could not be read
+            messagebox.showerror("Error", f"Could not load contacts from {self.contact_book.filename}:\n"
+                                          f"{self._load_error}\n\nThe application will close.")
+            self.root.destroy()
+            return
+        self.root.title("Contact Book")
+        self._shown_query = None
+        self._do_search()
+    
+    def _still_loading(self):
+        """Tell the user to wait if contacts are still loading. Returns True if they are."""
+        if self._loader is None:
+            return False
+        messagebox.showinfo("Loading", "Contacts are still loading, please try again in a moment.")
+        return True
+    
+    def setup_ui(self):
+        """Setup the user interface."""
+# Main frame
+        main_frame = ttk.Frame(self.root, padding="10")
+        main_frame.grid(row=0, column=0, sticky="nsew")
+        
+# --- GUI Responsiveness Fixes ---
+# Ensure all columns and rows expand as window resizes
+        self.root.columnconfigure(0, weight=1)
+        self.root.rowconfigure(0, weight=1)
+        main_frame.columnconfigure(0, weight=0)  # Buttons column
+        main_frame.columnconfigure(1, weight=1)  # List column
+        main_frame.rowconfigure(0, weight=0)     # Title row
+        main_frame.rowconfigure(1, weight=1)     # Main content row
+        main_frame.rowconfigure(2, weight=0)     # Search row
+
+# For search_frame
+        search_frame = ttk.Frame(main_frame)
+        search_frame.grid(row=2, column=0, columnspan=3, pady=10, sticky="we")
+        search_frame.columnconfigure(0, weight=0)
+        search_frame.columnconfigure(1, weight=1)
+
+# For list_frame
+        list_frame = ttk.Frame(main_frame)
+        list_frame.grid(row=1, column=1, sticky="nsew", padx=(10, 0))
+        list_frame.columnconfigure(0, weight=1)
+        list_frame.rowconfigure(0, weight=1)
+        
+# Treeview for contacts
+        columns = ('Name', 'Phone', 'Email', 'Address')
+        self.tree = ttk.Treeview(list_frame, columns=columns, show='headings', height=15)
+        
+# Configure columns
+        for col in columns:
+            self.tree.heading(col, text=col)
+            self.tree.column(col, width=150)
+        
+# Scrollbar
+        self.scrollbar = ttk.Scrollbar(list_frame, orient=tk.VERTICAL, command=self.on_scrollbar)
+        self.tree.configure(yscrollcommand=self.on_tree_yscroll)
+        
+        self.tree.grid(row=0, column=0, sticky="nsew")
+        self.scrollbar.grid(row=0, column=1, sticky="ns")
+        
+# Title
+        title_label = ttk.Label(main_frame, text="Contact Book", 
+                               font=('Arial', 16, 'bold'))
+        title_label.grid(row=0, column=0, columnspan=3, pady=(0, 20))
+        
+# Buttons frame
+        buttons_frame = ttk.Frame(main_frame)
+        buttons_frame.grid(row=1, column=0, sticky="nw", padx=(0, 10))
+        
+# Buttons
+        ttk.Button(buttons_frame, text="Add Contact", 
+                  command=self.add_contact_dialog).grid(row=0, column=0, pady=5, sticky=tk.W)
+        ttk.Button(buttons_frame, text="Edit Contact", 
+                  command=self.edit_contact_dialog).grid(row=1, column=0, pady=5, sticky=tk.W)
+        ttk.Button(buttons_frame, text="Delete Contact", 
+                  command=self.delete_contact_dialog).grid(row=2, column=0, pady=5, sticky=tk.W)
+        ttk.Button(buttons_frame, text="Search", 
+                  command=self.search_dialog).grid(row=3, column=0, pady=5, sticky=tk.W)
+        ttk.Button(buttons_frame, text="View Statistics", 
+                  command=self.show_statistics).grid(row=4, column=0, pady=5, sticky=tk.W)
+        
+# Search entry
+        ttk.Label(search_frame, text="Quick Search:").grid(row=0, column=0, padx=(0, 5))
+        self.search_var = tk.StringVar()
+        self.search_var.trace_add('write', self.on_search_change)
+        search_entry = ttk.Entry(search_frame, textvariable=self.search_var, width=40)
+        search_entry.grid(row=0, column=1, sticky="we")
+        
+# Bind double-click event
+        self.tree.bind('<Double-1>', self.on_contact_double_click)
+        
+# Scrolling and resizing for the virtualized list
+        self.tree.bind('<Configure>', self.on_tree_configure)
+        for sequence in ('<MouseWheel>', '<Button-4>', '<Button-5>'):
+            self.tree.bind(sequence, self.on_tree_mousewheel)
+    
+    def refresh_contact_list(self, contacts=None):
+        """Refresh the contact list display and keep Treeview in sync with backend.
+        Always clear selection after refresh to avoid stale selection issues when phone numbers change."""
+        if self._batch_depth:
+# Inside batch_updates(); the full list is refreshed once when the batch ends
+            self._batch_dirty = True
+            return
+        if contacts is None:
+            contacts = self.contact_book.get_all_contacts()
+            self._shown_query = ''
+        else:
+            self._view_offset = 0
+            self._shown_query = None
+        self._view = contacts
+        self._virtual = len(contacts) > _VIRTUAL_ROWS
+        self._render_view()
+# Always clear selection after refresh
+        self.tree.selection_set(())
+    
+    def _render_view(self):
+        """Show the listed contacts, or only the visible slice of them when virtualized."""
+        if not self._virtual:
+            self._sync_rows(self._view)
+            return
+        total = len(self._view)
+        self._view_offset = max(0, min(self._view_offset, total - self._visible_rows))
+        end = self._view_offset + self._visible_rows
+        self._sync_rows(self._view[self._view_offset:end])
+        self.scrollbar.set(self._view_offset / total, min(end, total) / total)
+    
+    def _sync_rows(self, contacts):
+        """Make the Treeview rows match contacts, touching only rows that differ."""
+# Rows are keyed by phone number; only touch rows that differ from what is shown
+        target = {contact.phone: contact for contact in contacts}
+        stale = [iid for iid in self._row_order if iid not in target]
+        order = [iid for iid in self._row_order if iid in target]
+# Large changes (initial load, broad searches) are applied with the tree detached
+        bulk = len(stale) + len(contacts) - len(order) > _BULK_REFRESH_ROWS
+        with self._batched_tree_update() if bulk else nullcontext():
+            if stale:
+                self.tree.delete(*stale)
+                for iid in stale:
+                    del self._rows[iid]
+            for index, contact in enumerate(contacts):
+                iid = contact.phone
+                values = (contact.name, contact.phone, contact.email, contact.address)
+                row = self._rows.get(iid)
+                if row is None:
+                    self.tree.insert('', index, iid=iid, values=values)
+                    order.insert(index, iid)
+                else:
+                    if row[1] != values:
+                        self.tree.item(iid, values=values)
+                    if order[index] != iid:
+                        self.tree.move(iid, '', index)
+# Rows before index are already in place, so look for iid only after it
+                        del order[order.index(iid, index)]
+                        order.insert(index, iid)
+                self._rows[iid] = (contact, values)
+        self._row_order = order
+    
+    def _update_row(self, contact):
+        """Redraw a single contact's row if it is shown and its values changed."""
+        iid = contact.phone
+        values = (contact.name, contact.phone, contact.email, contact.address)
+        row = self._rows.get(iid)
+        if row is not None and row[1] != values:
+            self.tree.item(iid, values=values)
+            self._rows[iid] = (contact, values)
+    
+    def _remove_row(self, iid):
+        """Remove a single row from the contact list."""
+        row = self._rows.get(iid)
+        if row is None:
+            return
+        contact = row[0]
+        self._view = [c for c in self._view if c is not contact]
+        if self._virtual:
+# The next contact below has to scroll into the freed slot
+            self._render_view()
+        else:
+            self.tree.delete(iid)
+            del self._rows[iid]
+            self._row_order.remove(iid)
+    
+    def on_scrollbar(self, *args):
+        """Handle scrollbar drags and clicks, moving the visible slice when virtualized."""
+        if not self._virtual:
+            self.tree.yview(*args)
+        elif args[0] == 'moveto':
+            self._scroll_to(int(float(args[1]) * len(self._view)))
+        elif args[0] == 'scroll':
+            step = self._visible_rows if args[2] == 'pages' else 1
+            self._scroll_to(self._view_offset + int(args[1]) * step)
+    
+    def on_tree_yscroll(self, first, last):
+        """Forward the Treeview's own scroll position unless the list is virtualized."""
+        if not self._virtual:
+            self.scrollbar.set(first, last)
+    
+    def on_tree_mousewheel(self, event):
+        """Scroll the visible slice with the mouse wheel when virtualized."""
+        if not self._virtual:
+            return None
+        step = -3 if event.num == 4 or event.delta > 0 else 3
+        self._scroll_to(self._view_offset + step)
+        return 'break'
+    
+    def on_tree_configure(self, event):
+        """Recompute how many rows fit when the Treeview is resized."""
+        row_height = int(ttk.Style().lookup('Treeview', 'rowheight') or 20)
+# One row's worth of height goes to the column headings
+        visible_rows = max(1, event.height // row_height - 1)
+        if visible_rows != self._visible_rows:
+            self._visible_rows = visible_rows
+            if self._virtual:
+                self._render_view()
+    
+    def _scroll_to(self, offset):
+        """Move the visible slice so it starts at offset."""
+        offset = max(0, min(offset, len(self._view) - self._visible_rows))
+        if offset != self._view_offset:
+            self._view_offset = offset
+            self._render_view()
+    
+    @contextmanager
+    def batch_updates(self):
+        """Defer list refreshes until the outermost batch ends, then refresh once. Reentrant."""
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._batch_dirty:
+                self._batch_dirty = False
+                self.refresh_contact_list()
+    
+    @contextmanager
+    def _batched_tree_update(self):
+        """Detach the Treeview while rows change so Tk lays it out once. Reentrant."""
+        self._tree_batch_depth += 1
+        if self._tree_batch_depth == 1:
+            self.tree.grid_remove()
+        try:
+            yield
+        finally:
+            self._tree_batch_depth -= 1
+            if self._tree_batch_depth == 0:
+                self.tree.grid()
+                self.tree.update_idletasks()
+    
+    def on_search_change(self, *args):
+        """Handle search input changes, waiting for typing to pause before searching."""
+        if self._search_after_id is not None:
+            self.root.after_cancel(self._search_after_id)
+        self._search_after_id = self.root.after(150, self._do_search)
+    
+    def _do_search(self):
+        """Run the quick search for the current query."""
+        self._search_after_id = None
+        if self._loader is not None:
+            return  # Searched once loading finishes
+        query = self.search_var.get().strip()
+# Edits that cancel out within the debounce window (typing then deleting) need no work
+        if query == self._shown_query:
+            return
+        if query:
+            results = self.contact_book.search_contacts(query)
+            self.refresh_contact_list(results)
+            self._shown_query = query
+        else:
+            self.refresh_contact_list()
+    
+    def get_selected_contact(self):
+        """Get the currently selected contact. Returns None and shows a warning if nothing is selected or if the contact is not found."""
+        selection = self.tree.selection()
+        if not selection:
+            messagebox.showwarning("No Selection", "Please select a contact first.")
+            return None
+        row = self._rows.get(selection[0])
+        contact = row[0] if row else None
+        if not contact:
+            messagebox.showwarning("Not Found", "Selected contact could not be found.")
+        return contact
+
+
+    def add_contact_dialog(self):
+        """Show dialog to add a new contact."""
+        if self._still_loading():
+            return
+        result = self.open_contact_dialog("Add New Contact")
+        if result:
+            try:
+                with self.batch_updates():
+                    self.contact_book.add_contact(**result)
+                    self.refresh_contact_list()
+                messagebox.showinfo("Success", "Contact added successfully!")
+            except ValueError as e:
+                messagebox.showerror("Error", str(e))
+    
+    def open_contact_dialog(self, title, contact=None):
+        """Show the shared contact dialog, creating it on first use, and return its result."""
+        if self._contact_dialog is None:
+            self._contact_dialog = ContactDialog(self.root, title, contact)
+        else:
+            self._contact_dialog.show(title, contact)
+        self._contact_dialog.wait()  # Wait for dialog to close
+        return self._contact_dialog.result
+    
+    def edit_contact_dialog(self):
+        """Show dialog to edit selected contact."""
+        contact = self.get_selected_contact()
+        if not contact:
+            return  # Feedback already given in get_selected_contact
+        result = self.open_contact_dialog("Edit Contact", contact)
+        if result:
+            try:
+                # Use the original phone to update, but allow phone to change
+                old_phone, old_name = contact.phone, contact.name_lower
+                with self.batch_updates():
+                    self.contact_book.update_contact(contact.phone, **result)
+# The contact is edited in place; unless its iid or sort position moved, redraw just its row
+                    if contact.phone == old_phone and contact.name_lower == old_name:
+                        self._update_row(contact)
+                    else:
+                        self.refresh_contact_list()
+                messagebox.showinfo("Success", "Contact updated successfully!")
+            except ValueError as e:
+                messagebox.showerror("Error", str(e))
+    
+    def delete_contact_dialog(self):
+        """Show dialog to delete selected contact."""
+        contact = self.get_selected_contact()
+        if not contact:
+            return  # Feedback already given in get_selected_contact
+        if messagebox.askyesno("Confirm Delete", f"Are you sure you want to delete {contact.name}?"):
+            self.contact_book.delete_contact(contact.phone)
+# Only the deleted row changes, so drop it instead of refreshing the whole list
+            self._remove_row(contact.phone)
+            messagebox.showinfo("Success", "Contact deleted successfully!")
+    
+    def search_dialog(self):
+        """Show advanced search dialog."""
+        if self._still_loading():
+            return
+        query = simpledialog.askstring("Search Contacts", 
+                                     "Enter search term (name, phone, email, or address):")
+        if query:
+            results = self.contact_book.search_contacts(query)
+            if results:
+                self.refresh_contact_list(results)
+                messagebox.showinfo("Search Results", f"Found {len(results)} contact(s)")
+            else:
+                messagebox.showinfo("Search Results", "No contacts found.")
+    
+    def show_statistics(self):
+        """Show contact book statistics."""
+        if self._still_loading():
+            return
+        stats = self.contact_book.get_statistics()
+        message = f"""Contact Book Statistics:
+        
+        Total Contacts: {stats['total_contacts']}
+        Contacts with Email: {stats['contacts_with_email']}
+        Contacts with Address: {stats['contacts_with_address']}"""
+        
+        messagebox.showinfo("Statistics", message)
+    
+    def on_contact_double_click(self, event):
+        """Handle double-click on contact to view details."""
+        contact = self.get_selected_contact()
+        if contact:
+            self.show_contact_details(contact)
+    
+    def show_contact_details(self, contact):
+        """Show detailed view of a contact."""
+        details_window = tk.Toplevel(self.root)
+        details_window.title(f"Contact Details - {contact.name}")
+        details_window.geometry("400x300")
+        details_window.configure(bg='#f0f0f0')
+        
+# Center the window
+        details_window.transient(self.root)
+        details_window.grab_set()
+        
+# Details frame
+        frame = ttk.Frame(details_window, padding="20")
+        frame.grid(row=0, column=0, sticky="nsew")
+        
+        details_window.columnconfigure(0, weight=1)
+        details_window.rowconfigure(0, weight=1)
+        frame.columnconfigure(1, weight=1)
+        
+# Contact details
+        ttk.Label(frame, text="Name:", font=('Arial', 10, 'bold')).grid(row=0, column=0, sticky=tk.W, pady=2)
+        ttk.Label(frame, text=contact.name).grid(row=0, column=1, sticky=tk.W, pady=2)
+        
+        ttk.Label(frame, text="Phone:", font=('Arial', 10, 'bold')).grid(row=1, column=0, sticky=tk.W, pady=2)
+        ttk.Label(frame, text=contact.phone).grid(row=1, column=1, sticky=tk.W, pady=2)
+        
+        ttk.Label(frame, text="Email:", font=('Arial', 10, 'bold')).grid(row=2, column=0, sticky=tk.W, pady=2)
+        ttk.Label(frame, text=contact.email or "N/A").grid(row=2, column=1, sticky=tk.W, pady=2)
+        
+        ttk.Label(frame, text="Address:", font=('Arial', 10, 'bold')).grid(row=3, column=0, sticky=tk.W, pady=2)
+        ttk.Label(frame, text=contact.address or "N/A").grid(row=3, column=1, sticky=tk.W, pady=2)
+        
+        ttk.Label(frame, text="Notes:", font=('Arial', 10, 'bold')).grid(row=4, column=0, sticky=tk.W, pady=2)
+        ttk.Label(frame, text=contact.notes or "N/A").grid(row=4, column=1, sticky=tk.W, pady=2)
+        
+        ttk.Label(frame, text="Created:", font=('Arial', 10, 'bold')).grid(row=5, column=0, sticky=tk.W, pady=2)
+        ttk.Label(frame, text=contact.created_date).grid(row=5, column=1, sticky=tk.W, pady=2)
+        
+        ttk.Label(frame, text="Modified:", font=('Arial', 10, 'bold')).grid(row=6, column=0, sticky=tk.W, pady=2)
+        ttk.Label(frame, text=contact.last_modified).grid(row=6, column=1, sticky=tk.W, pady=2)
+        
+# Close button
+        ttk.Button(frame, text="Close", command=details_window.destroy).grid(row=7, column=0, columnspan=2, pady=20)
+    
+    def _check_save_error(self):
+        """Report a failed background save; saves run off the Tk thread so they are polled."""
+        error = self.contact_book.save_error
+        if error is not None and error is not self._reported_save_error:
+            self._reported_save_error = error
+            messagebox.showerror("Error", f"Your changes could not be saved:\n{error}")
+        self.root.after(1000, self._check_save_error)
+    
+    def on_close(self):
+        """Write any pending changes, then close the window."""
+        try:
+            self.contact_book.flush()
+        except Exception as e:
+            if not messagebox.askyesno("Error", f"Your changes could not be saved:\n{e}\n\n"
+                                                "Close anyway and lose them?"):
+                return
+        self.root.destroy()
+    
+    def run(self):
+        """Start the GUI application."""
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+        self.root.after(1000, self._check_save_error)
+        self.root.mainloop()
+
+class ContactDialog:
+    """Dialog for adding/editing contacts."""
+    
+    def __init__(self, parent, title, contact=None):
+        self.result = None
+        
+# Create dialog window; it is hidden rather than destroyed on close so it can be reopened
+        self.dialog = tk.Toplevel(parent)
+        self.dialog.geometry("400x350")
+        self.dialog.configure(bg='#f0f0f0')
+        self.dialog.protocol("WM_DELETE_WINDOW", self.cancel)
+        
+# Center the window
+        self.dialog.transient(parent)
+        
+# Variables
+        self.name_var = tk.StringVar()
+        self.phone_var = tk.StringVar()
+        self.email_var = tk.StringVar()
+        self.address_var = tk.StringVar()
+        self.notes_var = tk.StringVar()
+        self.closed_var = tk.BooleanVar(value=False)
+        
+        self.setup_ui()
+        self.show(title, contact)
+    
+    def show(self, title, contact=None):
+        """Fill the form from contact (blank if None) and show the dialog."""
+        self.result = None
+        self.dialog.title(title)
+        self.name_var.set(contact.name if contact else "")
+        self.phone_var.set(contact.phone if contact else "")
+        self.email_var.set(contact.email if contact else "")
+        self.address_var.set(contact.address if contact else "")
+        self.notes_var.set(contact.notes if contact else "")
+# What the form was opened with; saving it unchanged is treated like a cancel
+        self._original = self._form_values() if contact else None
+        self.dialog.deiconify()
+        self.dialog.grab_set()
+        self.name_entry.focus_set()
+    
+    def wait(self):
+        """Block until the dialog is saved or cancelled."""
+        self.dialog.wait_variable(self.closed_var)
+    
+    def close(self):
+        """Hide the dialog and wake up wait()."""
+        self.dialog.grab_release()
+        self.dialog.withdraw()
+        self.closed_var.set(True)
+    
+    def setup_ui(self):
+        """Setup the dialog UI."""
+        frame = ttk.Frame(self.dialog, padding="20")
+        frame.grid(row=0, column=0, sticky="nsew")
+        
+        self.dialog.columnconfigure(0, weight=1)
+        self.dialog.rowconfigure(0, weight=1)
+        frame.columnconfigure(0, weight=1)
+        
+# Title and field labels are canvas text items; only the entries are real widgets
+        fields = (("Name *:", self.name_var), ("Phone *:", self.phone_var),
+                  ("Email:", self.email_var), ("Address:", self.address_var),
+                  ("Notes:", self.notes_var))
+        self.canvas = tk.Canvas(frame, height=50 + len(fields) * _FORM_ROW_HEIGHT,
+                                bg='#f0f0f0', highlightthickness=0)
+        self.canvas.grid(row=0, column=0, sticky="we")
+        self.canvas.create_text(0, 10, text="Contact Information", anchor=tk.N,
+                                font=('Arial', 12, 'bold'), tags='title')
+        
+# Form fields
+        self._entry_windows = []
+        for row, (label, var) in enumerate(fields):
+            y = 50 + row * _FORM_ROW_HEIGHT
+            self.canvas.create_text(0, y, text=label, anchor=tk.W)
+            entry = ttk.Entry(self.canvas, textvariable=var, width=30)
+            self._entry_windows.append(
+                self.canvas.create_window(_FORM_LABEL_WIDTH, y, window=entry, anchor=tk.W))
+            if row == 0:
+                self.name_entry = entry
+        self.canvas.bind('<Configure>', self.on_canvas_configure)
+        
+# Buttons
+        button_frame = ttk.Frame(frame)
+        button_frame.grid(row=1, column=0, pady=20)
+        
+        ttk.Button(button_frame, text="Save", command=self.save).grid(row=0, column=0, padx=5)
+        ttk.Button(button_frame, text="Cancel", command=self.cancel).grid(row=0, column=1, padx=5)
+    
+    def on_canvas_configure(self, event):
+        """Keep the title centred and stretch the entries to the form width."""
+        self.canvas.coords('title', event.width / 2, 10)
+        for window in self._entry_windows:
+            self.canvas.itemconfigure(window, width=max(1, event.width - _FORM_LABEL_WIDTH))
+    
+    def save(self):
+        """Save the contact information."""
+        name = self.name_var.get().strip()
+        phone = self.phone_var.get().strip()
+        
+        if not name or not phone:
+            messagebox.showerror("Error", "Name and phone number are required.")
+            return
+        
+        values = self._form_values()
+        self.result = values if values != self._original else None
+        
+        self.close()
+    
+    def _form_values(self):
+        """Return the form's current, stripped field values."""
+        return {
+            'name': self.name_var.get().strip(),
+            'phone': self.phone_var.get().strip(),
+            'email': self.email_var.get().strip(),
+            'address': self.address_var.get().strip(),
+            'notes': self.notes_var.get().strip()
+        }
+    
+    def cancel(self):
+        """Cancel the dialog."""
+        self.close()
+
+if __name__ == "__main__":
+    ContactBookGUI(ContactBook(save_delay=0.5, load=False)).run()
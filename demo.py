@@ -4,14 +4,20 @@ Demo script for the Contact Book application.
 This script demonstrates how to use the ContactBook class programmatically.
 """
 
+import io
+import sys
+from contextlib import redirect_stdout
 from contact_book import ContactBook, Contact
 
+# Rule printed around each demo section
+_SEP = "=" * 60
+
 def demo_contact_book():
     """Demonstrate the Contact Book functionality."""
     
-    print("=" * 60)
+    print(_SEP)
     print("           CONTACT BOOK DEMO")
-    print("=" * 60)
+    print(_SEP)
     
     # Create a new contact book
     contact_book = ContactBook("demo_contacts.json")
@@ -20,35 +26,37 @@ def demo_contact_book():
     print("\n1. Adding sample contacts...")
     
     try:
-        # Add first contact
-        contact1 = contact_book.add_contact(
-            name="John Doe",
-            phone="555-123-4567",
-            email="john.doe@email.com",
-            address="123 Main Street, City, State 12345",
-            notes="Work colleague"
-        )
-        print(f"✓ Added: {contact1}")
+        # Save once after all three contacts are added
+        with contact_book.bulk():
+            # Add first contact
+            contact1 = contact_book.add_contact(
+                name="John Doe",
+                phone="555-123-4567",
+                email="john.doe@email.com",
+                address="123 Main Street, City, State 12345",
+                notes="Work colleague"
+            )
+            print(f"✓ Added: {contact1}")
         
-        # Add second contact
-        contact2 = contact_book.add_contact(
-            name="Jane Smith",
-            phone="555-987-6543",
-            email="jane.smith@email.com",
-            address="456 Oak Avenue, Town, State 67890",
-            notes="Friend from college"
-        )
-        print(f"✓ Added: {contact2}")
+            # Add second contact
+            contact2 = contact_book.add_contact(
+                name="Jane Smith",
+                phone="555-987-6543",
+                email="jane.smith@email.com",
+                address="456 Oak Avenue, Town, State 67890",
+                notes="Friend from college"
+            )
+            print(f"✓ Added: {contact2}")
         
-        # Add third contact
-        contact3 = contact_book.add_contact(
-            name="Bob Johnson",
-            phone="555-555-5555",
-            email="bob.johnson@email.com",
-            address="789 Pine Road, Village, State 11111",
-            notes="Neighbor"
-        )
-        print(f"✓ Added: {contact3}")
+            # Add third contact
+            contact3 = contact_book.add_contact(
+                name="Bob Johnson",
+                phone="555-555-5555",
+                email="bob.johnson@email.com",
+                address="789 Pine Road, Village, State 11111",
+                notes="Neighbor"
+            )
+            print(f"✓ Added: {contact3}")
         
     except ValueError as e:
         print(f"Error adding contact: {e}")
@@ -107,16 +115,16 @@ def demo_contact_book():
         print(f"   Created: {contact.created_date}")
         print(f"   Modified: {contact.last_modified}")
     
-    print("\n" + "=" * 60)
+    print("\n" + _SEP)
     print("Demo completed! Check 'demo_contacts.json' for the saved data.")
-    print("=" * 60)
+    print(_SEP)
 
 def demo_contact_class():
     """Demonstrate the Contact class functionality."""
     
-    print("\n" + "=" * 60)
+    print("\n" + _SEP)
     print("           CONTACT CLASS DEMO")
-    print("=" * 60)
+    print(_SEP)
     
     # Create a contact
     contact = Contact(
@@ -158,12 +166,17 @@ def demo_contact_class():
     new_contact = Contact.from_dict(contact_dict)
     print(f"\nRecreated contact: {new_contact}")
     
-    print("\n" + "=" * 60)
+    print("\n" + _SEP)
 
 if __name__ == "__main__":
-    # Run the demos
-    demo_contact_book()
-    demo_contact_class()
+    # Run the demos, collecting their output and writing it in one go
+    buffer = io.StringIO()
+    try:
+        with redirect_stdout(buffer):
+            demo_contact_book()
+            demo_contact_class()
+    finally:
+        sys.stdout.write(buffer.getvalue())
     
     print("\nTo run the full application with GUI or console interface:")
     print("python contact_book.py") 
\ No newline at end of file
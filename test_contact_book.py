@@ -4,10 +4,16 @@ Test script for the Contact Book application.
 This script tests all major functionality and error handling.
 """
 
+import atexit
 import os
+import shutil
 import tempfile
 from contact_book import ContactBook, Contact
 
+# One scratch directory for the whole run; each test uses its own file in it
+_TMPDIR = tempfile.mkdtemp()
+atexit.register(shutil.rmtree, _TMPDIR, ignore_errors=True)
+
 def test_contact_class():
     """Test the Contact class functionality."""
     print("Testing Contact class...")
@@ -26,13 +32,39 @@ def test_contact_class():
     assert contact.name == "Updated User"
     assert contact.email == "updated@email.com"
     print("✓ Contact update works")
+
+    # No-op update leaves the contact untouched
+    last_modified = contact.last_modified
+    contact.last_modified = "unchanged"
+    assert not contact.update(name="Updated User")
+    assert contact.last_modified == "unchanged"
+    contact.last_modified = last_modified
+    print("✓ No-op update is detected")
+
+    # Caller-supplied timestamp is used for the modification date
+    assert contact.update(now="2024-01-01 00:00:00", notes="Batch notes")
+    assert contact.last_modified == "2024-01-01 00:00:00"
+    print("✓ Shared update timestamp works")
+
+    # Derived slots cannot be overwritten through update()
+    assert not contact.update(name_lower="spoofed", _json_cache=b"{}")
+    assert contact.name_lower == "updated user"
+    print("✓ Update ignores internal fields")
     
     # Test to_dict and from_dict
     contact_dict = contact.to_dict()
     new_contact = Contact.from_dict(contact_dict)
     assert new_contact.name == contact.name
     assert new_contact.phone == contact.phone
+    assert new_contact.to_json() is new_contact.to_json()
+    new_contact.update(name="Encoded User")
+    assert b"Encoded User" in new_contact.to_json()
     print("✓ Contact serialization works")
+
+    # Fields are normalized on construction
+    padded = Contact.from_dict({'name': " Padded ", 'phone': " 555-0000 "})
+    assert padded.name == "Padded" and padded.phone == "555-0000"
+    print("✓ Contact field normalization works")
     
     print("✓ All Contact class tests passed!\n")
 
@@ -40,11 +72,10 @@ def test_contact_book_basic():
     """Test basic ContactBook functionality."""
     print("Testing ContactBook basic functionality...")
     
-    temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.json')
-    temp_file.close()
+    path = os.path.join(_TMPDIR, "basic.json")
     
     try:
-        contact_book = ContactBook(temp_file.name)
+        contact_book = ContactBook(path)
         
         # Add contacts
         contact1 = contact_book.add_contact("Alice", "111-111-1111", "alice@test.com")
@@ -57,6 +88,7 @@ def test_contact_book_basic():
         all_contacts = contact_book.get_all_contacts()
         assert len(all_contacts) == 2
         assert all_contacts[0].name == "Alice"
+        assert contact_book.get_all_contacts() is all_contacts
         print("✓ Getting all contacts works")
         
         # Search contacts
@@ -69,8 +101,20 @@ def test_contact_book_basic():
         contact_book.update_contact("111-111-1111", name="Alice Updated")
         contact = contact_book.get_contact_by_phone("111-111-1111")
         assert contact is not None and contact.name == "Alice Updated"
+        assert contact_book.search_contacts("alice updated") == [contact]
         print("✓ Contact update works")
-        
+
+        # Change phone number
+        contact_book.update_contact("111-111-1111", phone="111-000-0000")
+        assert contact_book.get_contact_by_phone("111-111-1111") is None
+        assert contact_book.get_contact_by_phone("111-000-0000") is contact
+        try:
+            contact_book.update_contact("111-000-0000", phone="222-222-2222")
+            assert False, "Should have raised ValueError for duplicate phone"
+        except ValueError:
+            pass
+        print("✓ Phone number update works")
+
         # Delete contact
         deleted = contact_book.delete_contact("222-222-2222")
         assert deleted
@@ -80,11 +124,20 @@ def test_contact_book_basic():
         # Statistics
         stats = contact_book.get_statistics()
         assert stats['total_contacts'] == 1
+        assert stats['contacts_with_email'] == 1
+        assert stats['contacts_with_address'] == 0
+        contact_book.update_contact("111-000-0000", address="1 Test Rd")
+        assert contact_book.get_statistics()['contacts_with_address'] == 1
+        contact_book.update_contact("111-000-0000", address="")
+        assert contact_book.get_contact_by_phone("111-000-0000").address == ""
+        assert contact_book.get_statistics()['contacts_with_address'] == 0
         print("✓ Statistics work")
         
     finally:
-        if os.path.exists(temp_file.name):
-            os.unlink(temp_file.name)
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
     
     print("✓ All basic ContactBook tests passed!\n")
 
@@ -92,11 +145,10 @@ def test_contact_book_validation():
     """Test ContactBook validation and error handling."""
     print("Testing ContactBook validation...")
     
-    temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.json')
-    temp_file.close()
+    path = os.path.join(_TMPDIR, "validation.json")
     
     try:
-        contact_book = ContactBook(temp_file.name)
+        contact_book = ContactBook(path)
         
         # Empty name
         try:
@@ -112,6 +164,30 @@ def test_contact_book_validation():
         except ValueError:
             print("✓ Empty phone validation works")
         
+        # Malformed phone and email
+        for phone, email in (("abc", ""), ("123-456-7890", "not-an-email")):
+            try:
+                contact_book.add_contact("Test User", phone, email)
+                assert False, "Should have raised ValueError"
+            except ValueError:
+                pass
+        print("✓ Phone and email format validation works")
+
+        # Short numbers and extensions are accepted
+        contact_book.add_contact("Emergency", "911")
+        contact_book.add_contact("Office", "555-1234 ext 2")
+        contact_book.delete_contact("911")
+        contact_book.delete_contact("555-1234 ext 2")
+        print("✓ Short and extension phone numbers work")
+
+        # An unchanged email saved before validation does not block other edits
+        legacy = contact_book.add_contact("Legacy User", "555-000-1111")
+        legacy.email = "user@localhost"
+        contact_book.update_contact("555-000-1111", name="Legacy Renamed", email="user@localhost")
+        assert legacy.name == "Legacy Renamed"
+        contact_book.delete_contact("555-000-1111")
+        print("✓ Unchanged legacy email does not block updates")
+        
         # Duplicate phone
         contact_book.add_contact("User 1", "123-456-7890")
         try:
@@ -133,14 +209,24 @@ def test_contact_book_validation():
             assert str(e) == "Contact not found."
             print("✓ Non-existent contact update handling works")
         
+        # Required fields cannot be cleared by an update
+        try:
+            contact_book.update_contact("123-456-7890", name="  ")
+            assert False, "Should have raised ValueError for empty name"
+        except ValueError:
+            assert contact_book.get_contact_by_phone("123-456-7890").name == "User 1"
+            print("✓ Update required-field validation works")
+        
         # Non-existent delete
         deleted = contact_book.delete_contact("999-999-9999")
         assert not deleted
         print("✓ Non-existent contact deletion handling works")
         
     finally:
-        if os.path.exists(temp_file.name):
-            os.unlink(temp_file.name)
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
     
     print("✓ All validation tests passed!\n")
 
@@ -148,17 +234,112 @@ def test_file_operations():
     """Test file I/O operations."""
     print("Testing file operations...")
     
-    temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.json')
-    temp_file.close()
+    path = os.path.join(_TMPDIR, "file_operations.json")
     
     try:
-        contact_book1 = ContactBook(temp_file.name)
+        contact_book1 = ContactBook(path)
         contact_book1.add_contact("Test User", "123-456-7890", "test@email.com")
         
-        contact_book2 = ContactBook(temp_file.name)
+        contact_book2 = ContactBook(path)
         assert len(contact_book2.contacts) == 1
-        assert contact_book2.contacts[0].name == "Test User"
+        assert contact_book2.contacts["123-456-7890"].name == "Test User"
         print("✓ File save/load works")
+
+        deferred_book = ContactBook(path, load=False)
+        assert not deferred_book.loaded and len(deferred_book.contacts) == 0
+        deferred_book.load_contacts()
+        assert deferred_book.loaded and len(deferred_book.contacts) == 1
+        print("✓ Deferred load works")
+
+        delayed_book = ContactBook(path, save_delay=60)
+        delayed_book.add_contact("Delayed User", "555-555-5555")
+        assert len(ContactBook(path).contacts) == 1
+        delayed_book.flush()
+        assert len(ContactBook(path).contacts) == 2
+        print("✓ Delayed save works")
+
+        failing_book = ContactBook(os.path.join(_TMPDIR, "missing_dir", "contacts.json"))
+        try:
+            failing_book.add_contact("Unsaved User", "444-444-4444")
+            assert False, "Should have raised for an unwritable path"
+        except Exception:
+            assert failing_book.save_error is not None
+        print("✓ Save errors are recorded")
+
+        contact_book1.reload()
+        assert len(contact_book1.contacts) == 2
+        assert contact_book1.search_contacts("delayed")[0].phone == "555-555-5555"
+        print("✓ Reload works")
+
+        added = delayed_book.add_contacts([
+            {'name': "Bulk One", 'phone': "666-666-6666"},
+            {'name': "Bulk Two", 'phone': "777-777-7777", 'email': "two@test.com"},
+        ])
+        assert [c.name for c in added] == ["Bulk One", "Bulk Two"]
+        assert added[0].created_date == added[1].created_date
+        try:
+            delayed_book.add_contacts([{'name': "Bulk Three", 'phone': "888-888-8888"},
+                                       {'name': "Bulk Dup", 'phone': "666-666-6666"}])
+            assert False, "Should have raised ValueError for duplicate phone"
+        except ValueError:
+            pass
+        delayed_book.flush()
+        assert len(ContactBook(path).contacts) == 5
+        print("✓ Bulk add works")
+
+        bulk_book = ContactBook(path)
+        with bulk_book.bulk():
+            bulk_book.add_contact("Bulk Four", "999-999-9999")
+            bulk_book.delete_contact("666-666-6666")
+            assert "999-999-9999" not in ContactBook(path).contacts
+        reloaded = ContactBook(path).contacts
+        assert "999-999-9999" in reloaded and "666-666-6666" not in reloaded
+        print("✓ Deferred bulk save works")
+        
+        export_file = path + ".export"
+        try:
+            contact_book1.export_contacts(export_file)
+            with open(export_file, encoding='utf-8') as file:
+                text = file.read()
+            assert '\n  {' in text
+            assert ContactBook(export_file).contacts["123-456-7890"].name == "Test User"
+        finally:
+            os.unlink(export_file)
+        print("✓ Readable export works")
+        
+        # Null optional fields load as empty strings
+        null_file = os.path.join(_TMPDIR, "nulls.json")
+        with open(null_file, 'w', encoding='utf-8') as file:
+            file.write('[{"name": "N", "phone": "555-010-0000", "email": null, "address": null, "notes": null}]')
+        contact = ContactBook(null_file).contacts["555-010-0000"]
+        assert (contact.email, contact.address, contact.notes) == ("", "", "")
+        os.unlink(null_file)
+        print("✓ Null optional fields load")
+        
+        # Saving keeps the file's existing permissions
+        if os.name == 'posix':
+            mode_file = os.path.join(_TMPDIR, "mode.json")
+            mode_book = ContactBook(mode_file)
+            mode_book.add_contact("M", "555-020-0000")
+            os.chmod(mode_file, 0o640)
+            mode_book.add_contact("O", "555-020-0001")
+            assert os.stat(mode_file).st_mode & 0o777 == 0o640
+            os.unlink(mode_file)
+            print("✓ Saving keeps file permissions")
+        
+        # Duplicate phones in the file are refused instead of silently dropped
+        duplicate_file = os.path.join(_TMPDIR, "duplicates.json")
+        with open(duplicate_file, 'w', encoding='utf-8') as file:
+            file.write('[{"name": "A", "phone": "555"}, {"name": "B", "phone": "555 "}]')
+        try:
+            ContactBook(duplicate_file)
+            assert False, "Should have raised ValueError for duplicate phones"
+        except ValueError as e:
+            assert "555" in str(e)
+        with open(duplicate_file, encoding='utf-8') as file:
+            assert '"B"' in file.read()
+        os.unlink(duplicate_file)
+        print("✓ Duplicate phones in file are refused")
         
         non_existent_file = "/non/existent/path/contacts.json"
         contact_book3 = ContactBook(non_existent_file)
@@ -166,8 +347,10 @@ def test_file_operations():
         print("✓ Non-existent file handling works")
         
     finally:
-        if os.path.exists(temp_file.name):
-            os.unlink(temp_file.name)
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
     
     print("✓ All file operation tests passed!\n")
 
@@ -175,11 +358,10 @@ def test_search_functionality():
     """Test search functionality thoroughly."""
     print("Testing search functionality...")
     
-    temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.json')
-    temp_file.close()
+    path = os.path.join(_TMPDIR, "search.json")
     
     try:
-        contact_book = ContactBook(temp_file.name)
+        contact_book = ContactBook(path)
         
         contact_book.add_contact("John Doe", "111-111-1111", "john@test.com", "123 Main St")
         contact_book.add_contact("Jane Smith", "222-222-2222", "jane@test.com", "456 Oak Ave")
@@ -202,6 +384,40 @@ def test_search_functionality():
         assert results[0].name == "Bob Johnson"
         print("✓ Email search works")
         
+        # Address search
+        results = contact_book.search_contacts("oak ave")
+        assert [r.name for r in results] == ["Jane Smith"]
+        print("✓ Address search works")
+        
+        # Accent-insensitive search
+        contact_book.add_contact("José Núñez", "444-444-4444")
+        assert [r.name for r in contact_book.search_contacts("jose nunez")] == ["José Núñez"]
+        assert [r.name for r in contact_book.search_contacts("NÚÑ")] == ["José Núñez"]
+        contact_book.delete_contact("444-444-4444")
+        print("✓ Accent-insensitive search works")
+        
+        # Extending the previous query narrows its results
+        assert len(contact_book.search_contacts("jo")) == 2
+        results = contact_book.search_contacts("joh")
+        assert len(results) == 2
+        results = contact_book.search_contacts("john d")
+        assert [r.name for r in results] == ["John Doe"]
+        print("✓ Incremental search works")
+
+        # Repeated queries are answered again after the book changes
+        assert [r.name for r in contact_book.search_contacts("jane")] == ["Jane Smith"]
+        contact_book.add_contact("Janet Lee", "555-123-4567")
+        assert [r.name for r in contact_book.search_contacts("jane")] == ["Jane Smith", "Janet Lee"]
+        contact_book.delete_contact("555-123-4567")
+        assert [r.name for r in contact_book.search_contacts("jane")] == ["Jane Smith"]
+        print("✓ Repeated search works")
+        
+        # Name prefix search
+        assert [r.name for r in contact_book.search_by_name_prefix("J")] == ["Jane Smith", "John Doe"]
+        assert [r.name for r in contact_book.search_by_name_prefix("bob j")] == ["Bob Johnson"]
+        assert contact_book.search_by_name_prefix("doe") == []
+        print("✓ Name prefix search works")
+        
         # No results
         results = contact_book.search_contacts("nonexistent")
         assert len(results) == 0
@@ -211,10 +427,48 @@ def test_search_functionality():
         results = contact_book.search_contacts("")
         assert len(results) == 3
         print("✓ Empty search returns all contacts")
-        
+
+        # Deleting keeps lookups consistent
+        assert len(contact_book.get_all_contacts()) == 3
+        assert contact_book.delete_contact("111-111-1111")
+        assert contact_book.get_contact_by_phone("333-333-3333").name == "Bob Johnson"
+        assert contact_book.delete_contact("333-333-3333")
+        assert [c.name for c in contact_book.contacts.values()] == ["Jane Smith"]
+        assert [c.name for c in contact_book.get_all_contacts()] == ["Jane Smith"]
+        print("✓ Search after delete works")
+
+    finally:
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+    
+    # Books of 1000+ contacts search through one joined corpus
+    large_path = os.path.join(_TMPDIR, "large.json")
+    try:
+        large_book = ContactBook(large_path)
+        large_book.add_contacts([
+            {'name': f"Person {i:04d}", 'phone': f"555-{i:04d}", 'email': f"p{i}@example.com"}
+            for i in range(1200)
+        ])
+        contacts = list(large_book.contacts.values())
+        for query in ("person 0000", "0042", "person 1199", "nomatch", "person 01"):
+            expected = [c for c in contacts
+                        if any(query in field.lower() for field in (c.name, c.phone, c.email, c.address))]
+            assert large_book.search_contacts(query) == expected, query
+        assert large_book.search_contacts("person 0000") == [contacts[0]]
+        assert large_book.search_contacts("person 1199") == [contacts[-1]]
+        # Past the hit cap the rest of the book is scanned directly; order must not change
+        query = "example.com"
+        expected = [c for c in contacts if query in c.email.lower()]
+        assert len(expected) > 256
+        assert large_book.search_contacts(query) == expected
+        print("✓ Large book search works")
     finally:
-        if os.path.exists(temp_file.name):
-            os.unlink(temp_file.name)
+        try:
+            os.unlink(large_path)
+        except FileNotFoundError:
+            pass
     
     print("✓ All search tests passed!\n")
 